@@ -34,6 +34,9 @@ class MongoBackend(_Backend):
         Time to wait for connection attempt.
     cfg_path : str, optional
         Path to the happi config.
+    client : pymongo.MongoClient, optional
+        An existing client to use in place of connecting with ``host``,
+        ``user`` and ``pw``.
     """
 
     _timeout = 5
@@ -41,14 +44,16 @@ class MongoBackend(_Backend):
 
     def __init__(self, host=None, user=None,
                  pw=None, db=None, collection=None,
-                 timeout=None, cfg_path=None):
-        # Default timeout
-        timeout = timeout or self._timeout
-        # Format connection string
-        conn_str = self._conn_str.format(user=user, pw=pw,
-                                         host=host, db=db)
-        logging.debug('Attempting connection using %s ', conn_str)
-        self._client = MongoClient(conn_str, serverSelectionTimeoutMS=timeout)
+                 timeout=None, cfg_path=None, client=None):
+        if client is None:
+            # Default timeout
+            timeout = timeout or self._timeout
+            # Format connection string
+            conn_str = self._conn_str.format(user=user, pw=pw,
+                                             host=host, db=db)
+            logging.debug('Attempting connection using %s ', conn_str)
+            client = MongoClient(conn_str, serverSelectionTimeoutMS=timeout)
+        self._client = client
         self._db = self._client[db]
         # Load collection
         try:
@@ -1,7 +1,6 @@
 import fcntl
 import os
 import os.path
-import tempfile
 from typing import Any, Dict
 
 import pytest
@@ -12,8 +11,7 @@ from happi.backends.json_db import JSONBackend
 from happi.errors import DuplicateError, SearchError
 from happi.loader import load_devices
 
-from .conftest import (requires_mongo, requires_pcdsdevices, requires_py39,
-                       requires_questionnaire)
+from .conftest import requires_py39
 
 
 @pytest.fixture(scope='function')
@@ -22,17 +20,13 @@ def mockmongo(mockmongoclient):
 
 
 @pytest.fixture(scope='function')
-def mockjson(item_info: Dict[str, Any], valve_info: Dict[str, Any]):
+def mockjson(tmp_path, item_info: Dict[str, Any]):
     # Write underlying database
-    with tempfile.NamedTemporaryFile(mode='w') as handle:
-        simplejson.dump({item_info['_id']: item_info},
-                        handle)
-        handle.flush()
-        # Return handle name
-        yield JSONBackend(handle.name)
+    db_path = tmp_path / 'mockjson.json'
+    db_path.write_text(simplejson.dumps({item_info['_id']: item_info}))
+    return JSONBackend(str(db_path))
 
 
-@requires_mongo
 def test_mongo_find(
     valve_info: Dict[str, Any],
     item_info: Dict[str, Any],
@@ -60,7 +54,6 @@ def test_mongo_find(
                for info in (item_info, valve_info))
 
 
-@requires_mongo
 def test_mongo_save(
     mockmongo,
     item_info: Dict[str, Any],
@@ -79,7 +72,6 @@ def test_mongo_save(
     assert mockmongo._collection.find_one(valve_info) == valve_info
 
 
-@requires_mongo
 def test_mongo_delete(mockmongo, item_info: Dict[str, Any]):
     mockmongo.delete(item_info[Client._id_key])
     assert mockmongo._collection.find_one(item_info) is None
@@ -175,15 +167,13 @@ def test_json_initialize():
     os.remove("testing.json")
 
 
-@requires_questionnaire
 def test_qs_find(mockqsbackend):
     assert len(list(mockqsbackend.find(dict(beamline='TST')))) == 14
     assert len(list(mockqsbackend.find(dict(name='sam_r')))) == 1
 
 
-@requires_questionnaire
-@requires_pcdsdevices
 def test_qsbackend_with_client(mockqsbackend):
+    pytest.importorskip('pcdsdevices')
     c = Client(database=mockqsbackend)
     assert len(c.all_items) == 14
     assert all(
@@ -197,10 +187,9 @@ def test_qsbackend_with_client(mockqsbackend):
     assert item_types.count('Acromag') == 5
 
 
-@requires_questionnaire
-@requires_pcdsdevices
 @requires_py39
 def test_qsbackend_with_acromag(mockqsbackend):
+    pytest.importorskip('pcdsdevices')
     c = Client(database=mockqsbackend)
     d = load_devices(*c.all_items, pprint=False).__dict__
     ai1 = d.get('ai_7')
@@ -209,10 +198,9 @@ def test_qsbackend_with_acromag(mockqsbackend):
     assert ao1.__class__.__name__ == 'EpicsSignal'
 
 
-@requires_questionnaire
-@requires_pcdsdevices
 @requires_py39
 def test_beckoff_axis_device_class(mockqsbackend):
+    pytest.importorskip('pcdsdevices')
     c = Client(database=mockqsbackend)
     d = load_devices(*c.all_items).__dict__
     vh_y = d.get('vh_y')